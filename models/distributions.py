@@ -0,0 +1,181 @@
+import math
+import numpy as np
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+
+def uniform_fill(rng: np.random.Generator, out: np.ndarray, min_value: float, scale: float):
+    """Fill `out` in place with uniform samples on [min, min + scale)"""
+    # Generator.uniform has no out= argument, so scale U[0, 1) in place
+    rng.random(dtype=out.dtype, out=out)
+    out *= scale
+    out += min_value
+
+def triangular_fill(rng: np.random.Generator, out: np.ndarray, min_value: float,
+                    most_likely: float, max_value: float):
+    """Fill `out` in place with triangular samples"""
+    np.copyto(out, rng.triangular(min_value, most_likely, max_value, out.shape))
+
+def symmetric_triangular_fill(rng: np.random.Generator, out: np.ndarray, min_value: float,
+                              half_scale: float):
+    """Fill `out` in place with triangular samples on [min, min + 2 * half_scale] with a midpoint mode"""
+    # The mean of two independent uniforms is triangular on [0, 1] with its
+    # mode at 0.5, which avoids the per-sample branch of rng.triangular
+    rng.random(dtype=out.dtype, out=out)
+    out += rng.random(out.shape, dtype=out.dtype)
+    out *= half_scale
+    out += min_value
+
+def pert_params(min_value: float, most_likely: float, max_value: float) -> Optional[Tuple[float, float]]:
+    """
+    Beta shape parameters (alpha, beta) of a PERT distribution.
+
+    Returns:
+        The shape parameters, or None when the distribution is degenerate
+        (a zero-width range or a mean at one of the bounds)
+    """
+    # PERT uses a modified beta distribution
+    range_val = max_value - min_value
+    if range_val == 0:
+        return None
+
+    # Calculate shape parameters
+    mu = (min_value + 4 * most_likely + max_value) / 6
+
+    # If mu is equal to min or max, avoid division by zero
+    if mu == min_value or mu == max_value:
+        return None
+
+    v = (mu - min_value) * (max_value - mu) / (range_val ** 2)
+    alpha = ((mu - min_value) / range_val) * ((1 / v) - 1)
+    beta = (1 - (mu - min_value) / range_val) * ((1 / v) - 1)
+
+    return alpha, beta
+
+def pert_fill(rng: np.random.Generator, out: np.ndarray, alpha: float, beta: float,
+              min_value: float, range_val: float):
+    """Fill `out` in place with PERT samples (a Beta distribution rescaled to [min, max])"""
+    # Generate beta samples and scale to the min-max range
+    np.copyto(out, rng.beta(alpha, beta, out.shape))
+    out *= range_val
+    out += min_value
+
+def constant_fill(rng: np.random.Generator, out: np.ndarray, value: float):
+    """Fill `out` in place with a single value (degenerate distributions)"""
+    out[...] = value
+
+def lognormal_params(min_value: float, max_value: float) -> Tuple[float, float]:
+    """Lognormal (mu, sigma) whose 5th and 95th percentiles are min and max"""
+    # For lognormal, we interpret min/max as 5th and 95th percentiles
+    # (Appropriate for modeling losses that can be very large)
+    ln_min = float(np.log(min_value))
+    ln_max = float(np.log(max_value))
+
+    # Estimate mu and sigma for the lognormal distribution
+    # using the 5th and 95th percentiles
+    z_95 = 1.645  # Z-score for 95th percentile
+    sigma = (ln_max - ln_min) / (2 * z_95)
+    mu = (ln_min + ln_max) / 2
+    return mu, sigma
+
+def lognormal_fill(rng: np.random.Generator, out: np.ndarray, mu: float, sigma: float):
+    """Fill `out` in place with lognormal samples"""
+    # exp(mu + sigma * Z) computed in place on a standard normal draw
+    rng.standard_normal(dtype=out.dtype, out=out)
+    out *= sigma
+    out += mu
+    np.exp(out, out=out)
+
+def check_most_likely(distribution: str, min_value: float, max_value: float,
+                      most_likely: Optional[float]):
+    """Raise ValueError if a triangular or PERT mode lies outside [min, max]"""
+    # Only these distributions use the most likely value
+    if distribution.lower() not in ("triangular", "pert") or most_likely is None:
+        return
+    if not min_value <= most_likely <= max_value:
+        raise ValueError("Most likely value must be between the minimum and maximum values")
+
+def make_sampler(distribution: str, min_value: float, max_value: float,
+                 most_likely: Optional[float] = None) -> Callable:
+    """
+    Bind a distribution's parameters to its fill function.
+
+    Args:
+        distribution: Distribution name ('uniform', 'triangular', 'pert' or 'lognormal')
+        min_value: Minimum value of the input range
+        max_value: Maximum value of the input range
+        most_likely: Most likely value (triangular and PERT only)
+
+    Returns:
+        A callable sampler(rng, out) that fills `out` in place.
+        Unknown distributions default to uniform.
+    """
+    check_most_likely(distribution, min_value, max_value, most_likely)
+    distribution = distribution.lower()
+
+    if distribution in ("triangular", "pert"):
+        if most_likely is None:
+            most_likely = (min_value + max_value) / 2
+        if distribution == "pert":
+            shape = pert_params(min_value, most_likely, max_value)
+            if shape is None:
+                # Degenerate PERT always draws its mean
+                return partial(constant_fill, value=(min_value + 4 * most_likely + max_value) / 6)
+            return partial(
+                pert_fill,
+                alpha=shape[0],
+                beta=shape[1],
+                min_value=min_value,
+                range_val=max_value - min_value
+            )
+        if math.isclose(most_likely, (min_value + max_value) / 2, rel_tol=1e-12, abs_tol=1e-12):
+            return partial(symmetric_triangular_fill, min_value=min_value, half_scale=0.5 * (max_value - min_value))
+        return partial(triangular_fill, min_value=min_value, most_likely=most_likely, max_value=max_value)
+
+    if distribution == "lognormal":
+        mu, sigma = lognormal_params(min_value, max_value)
+        return partial(lognormal_fill, mu=mu, sigma=sigma)
+
+    # Default to uniform distribution. The range is precomputed so a draw is
+    # just one multiply and one add; Python float scalars keep that
+    # arithmetic in the dtype of `out` (float32 for simulation buffers).
+    return partial(uniform_fill, min_value=min_value, scale=max_value - min_value)
+
+# Fill functions whose parameters broadcast, so several inputs of the same
+# family can be drawn as one (k, N) block with (k, 1) parameter columns
+_BROADCASTABLE_FILLS = (
+    uniform_fill,
+    triangular_fill,
+    symmetric_triangular_fill,
+    pert_fill,
+    lognormal_fill,
+    constant_fill
+)
+
+def fill_many(rng: np.random.Generator, samplers: List[partial], out: np.ndarray):
+    """
+    Fill each row of `out` with samples from the matching sampler.
+
+    Samplers sharing a broadcastable fill function are drawn together in a
+    single vectorised call; any others are filled row by row.
+
+    Args:
+        rng: Random number generator to draw from
+        samplers: One sampler (as returned by make_sampler) per row of `out`
+        out: A (len(samplers), N) array to fill in place
+    """
+    groups: Dict[Callable, List[int]] = {}
+    for i, sampler in enumerate(samplers):
+        groups.setdefault(sampler.func, []).append(i)
+
+    for fill, rows in groups.items():
+        block = np.empty((len(rows), out.shape[1]), dtype=out.dtype)
+        if fill in _BROADCASTABLE_FILLS:
+            params = {
+                name: np.array([samplers[i].keywords[name] for i in rows], dtype=np.float64)[:, None]
+                for name in samplers[rows[0]].keywords
+            }
+            fill(rng, block, **params)
+        else:
+            for row, i in zip(block, rows):
+                samplers[i](rng, row)
+        out[rows] = block
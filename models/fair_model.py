@@ -1,15 +1,16 @@
-import numpy as np
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass, field, fields
+from typing import Callable, Dict, Tuple, Optional
+from models.distributions import make_sampler
 
 
-@dataclass
+@dataclass(slots=True)
 class TEFInput:
     """Threat Event Frequency input parameters"""
     min_value: float  # Minimum expected events per year
     max_value: float  # Maximum expected events per year
     most_likely: Optional[float] = None  # Most likely value (for triangular distribution)
     distribution: str = "uniform"  # Can be 'uniform', 'triangular', 'pert', etc.
+    _sampler: Callable = field(init=False, repr=False, compare=False)  # Bound in __post_init__
     
     def __post_init__(self):
         if self.min_value < 0:
@@ -18,15 +19,19 @@ class TEFInput:
             raise ValueError("Maximum value must be greater than minimum value")
         if self.distribution in ["triangular", "pert"] and self.most_likely is None:
             self.most_likely = (self.min_value + self.max_value) / 2
+        self._sampler = make_sampler(
+            self.distribution, self.min_value, self.max_value, self.most_likely
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class VulnerabilityInput:
     """Vulnerability input parameters (probability of threat event becoming loss event)"""
     min_value: float  # Minimum probability (0-1)
     max_value: float  # Maximum probability (0-1)
     most_likely: Optional[float] = None  # Most likely value (for triangular distribution)
     distribution: str = "uniform"  # Can be 'uniform', 'triangular', 'pert', etc.
+    _sampler: Callable = field(init=False, repr=False, compare=False)  # Bound in __post_init__
     
     def __post_init__(self):
         if not 0 <= self.min_value <= 1:
@@ -37,15 +42,19 @@ class VulnerabilityInput:
             raise ValueError("Maximum value must be greater than minimum value")
         if self.distribution in ["triangular", "pert"] and self.most_likely is None:
             self.most_likely = (self.min_value + self.max_value) / 2
+        self._sampler = make_sampler(
+            self.distribution, self.min_value, self.max_value, self.most_likely
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class LossInput:
     """Loss magnitude input parameters"""
     min_value: float  # Minimum loss amount
     max_value: float  # Maximum loss amount
     most_likely: Optional[float] = None  # Most likely value (for triangular distribution)
     distribution: str = "uniform"  # Can be 'uniform', 'triangular', 'pert', etc.
+    _sampler: Callable = field(init=False, repr=False, compare=False)  # Bound in __post_init__
     
     def __post_init__(self):
         if self.min_value < 0:
@@ -54,6 +63,15 @@ class LossInput:
             raise ValueError("Maximum value must be greater than minimum value")
         if self.distribution in ["triangular", "pert"] and self.most_likely is None:
             self.most_likely = (self.min_value + self.max_value) / 2
+        self._sampler = make_sampler(
+            self.distribution, self.min_value, self.max_value, self.most_likely
+        )
+
+
+def _input_to_dict(param) -> Dict:
+    """Convert an input dataclass to a dictionary of its constructor arguments"""
+    # dataclasses.asdict would also pick up the private slot fields
+    return {f.name: getattr(param, f.name) for f in fields(param) if f.init}
 
 
 class FAIRModel:
@@ -105,24 +123,9 @@ class FAIRModel:
         return {
             "name": self.name,
             "description": self.description,
-            "tef": {
-                "min_value": self.tef.min_value,
-                "max_value": self.tef.max_value,
-                "most_likely": self.tef.most_likely,
-                "distribution": self.tef.distribution
-            } if self.tef else None,
-            "vulnerability": {
-                "min_value": self.vulnerability.min_value,
-                "max_value": self.vulnerability.max_value,
-                "most_likely": self.vulnerability.most_likely,
-                "distribution": self.vulnerability.distribution
-            } if self.vulnerability else None,
-            "loss_magnitude": {
-                "min_value": self.loss_magnitude.min_value,
-                "max_value": self.loss_magnitude.max_value,
-                "most_likely": self.loss_magnitude.most_likely,
-                "distribution": self.loss_magnitude.distribution
-            } if self.loss_magnitude else None
+            "tef": _input_to_dict(self.tef) if self.tef else None,
+            "vulnerability": _input_to_dict(self.vulnerability) if self.vulnerability else None,
+            "loss_magnitude": _input_to_dict(self.loss_magnitude) if self.loss_magnitude else None
         }
     
     @classmethod
@@ -131,27 +134,45 @@ class FAIRModel:
         model = cls(data["name"], data["description"])
         
         if data["tef"]:
-            model.set_threat_event_frequency(TEFInput(
-                min_value=data["tef"]["min_value"],
-                max_value=data["tef"]["max_value"],
-                most_likely=data["tef"]["most_likely"],
-                distribution=data["tef"]["distribution"]
-            ))
+            model.set_threat_event_frequency(TEFInput(**data["tef"]))
         
         if data["vulnerability"]:
-            model.set_vulnerability(VulnerabilityInput(
-                min_value=data["vulnerability"]["min_value"],
-                max_value=data["vulnerability"]["max_value"],
-                most_likely=data["vulnerability"]["most_likely"],
-                distribution=data["vulnerability"]["distribution"]
-            ))
+            model.set_vulnerability(VulnerabilityInput(**data["vulnerability"]))
         
         if data["loss_magnitude"]:
-            model.set_loss_magnitude(LossInput(
-                min_value=data["loss_magnitude"]["min_value"],
-                max_value=data["loss_magnitude"]["max_value"],
-                most_likely=data["loss_magnitude"]["most_likely"],
-                distribution=data["loss_magnitude"]["distribution"]
-            ))
+            model.set_loss_magnitude(LossInput(**data["loss_magnitude"]))
         
         return model
+
+
+def _freeze(params: Dict) -> Tuple:
+    """Hashable (name, value) pairs of an input dictionary"""
+    return tuple(params.items())
+
+
+@dataclass(frozen=True, slots=True)
+class FAIRKey:
+    """Hashable snapshot of the FAIR inputs that determine the simulation results"""
+    tef: Tuple  # (field, value) pairs of the TEF input
+    vulnerability: Tuple  # (field, value) pairs of the Vulnerability input
+    loss_magnitude: Tuple  # (field, value) pairs of the Loss Magnitude input
+    
+    @classmethod
+    def from_model(cls, model: FAIRModel) -> 'FAIRKey':
+        """Capture the inputs of a configured FAIR model"""
+        model.validate_inputs()
+        return cls(
+            tef=_freeze(_input_to_dict(model.tef)),
+            vulnerability=_freeze(_input_to_dict(model.vulnerability)),
+            loss_magnitude=_freeze(_input_to_dict(model.loss_magnitude))
+        )
+    
+    def to_model(self, name: str = "", description: str = "") -> FAIRModel:
+        """Rebuild an equivalent FAIR model from the captured inputs"""
+        return FAIRModel.from_dict({
+            "name": name,
+            "description": description,
+            "tef": dict(self.tef),
+            "vulnerability": dict(self.vulnerability),
+            "loss_magnitude": dict(self.loss_magnitude)
+        })
@@ -1,168 +1,238 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
-from models.fair_model import FAIRModel, TEFInput, VulnerabilityInput, LossInput
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from models.fair_model import FAIRModel
+from models.distributions import fill_many
+
+# Column layout of the simulation results buffer
+RESULT_COLUMNS = ['TEF', 'Vulnerability', 'LEF', 'Loss Magnitude', 'ALE']
+TEF, VULNERABILITY, LEF, LOSS_MAGNITUDE, ALE = range(len(RESULT_COLUMNS))
+
+# Quantiles reported by get_summary_statistics (the median plus ALE percentiles)
+_SUMMARY_QUANTILES = [0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99]
+
+# Single precision is ample for the range estimates feeding the model and
+# halves the memory traffic of sampling and the percentile reductions
+RESULT_DTYPE = np.float32
+
+def _as_seed_sequence(seed) -> np.random.SeedSequence:
+    """Wrap an int (or None, for fresh OS entropy) in a SeedSequence"""
+    if isinstance(seed, np.random.SeedSequence):
+        # Spawning children advances the caller's SeedSequence, so work on an
+        # unspawned copy; the same SeedSequence then always gives the same runs
+        return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size)
+    return np.random.SeedSequence(seed)
+
+def _simulate_one(model_dict: Dict, num_simulations: int, seed) -> np.ndarray:
+    """Run a single simulation in a worker process and return its results buffer"""
+    simulation = MonteCarloSimulation(FAIRModel.from_dict(model_dict), num_simulations, seed=seed)
+    simulation.run_simulation()
+    return simulation.results_arr
 
 class MonteCarloSimulation:
     """Performs Monte Carlo simulations for the FAIR model"""
     
-    def __init__(self, fair_model: FAIRModel, num_simulations: int = 10000):
+    # Shared generator for unseeded simulations, so each quick UI run does
+    # not pay for building and seeding a fresh one
+    _shared_rng = np.random.default_rng()
+    
+    def __init__(self, fair_model: FAIRModel, num_simulations: int = 10000, seed=None):
         """
         Initialize the Monte Carlo simulation.
         
         Args:
             fair_model: The configured FAIR model with all parameters
             num_simulations: Number of simulations to run (default: 10000)
+            seed: Optional seed (int or np.random.SeedSequence) for reproducible runs
         """
         self.fair_model = fair_model
         self.num_simulations = num_simulations
-        self.results = None
-        
-    def _generate_distribution_sample(self, param, size=1):
-        """Generate random samples from the specified distribution"""
-        distribution = param.distribution.lower()
-        
-        if distribution == "uniform":
-            return np.random.uniform(param.min_value, param.max_value, size)
-        
-        elif distribution == "triangular":
-            return np.random.triangular(
-                param.min_value, 
-                param.most_likely, 
-                param.max_value, 
-                size
-            )
-            
-        elif distribution == "pert":
-            # PERT distribution approximation using Beta distribution
-            # Calculate alpha and beta parameters for Beta distribution
-            if param.most_likely is None:
-                param.most_likely = (param.min_value + param.max_value) / 2
-                
-            # PERT uses a modified beta distribution
-            range_val = param.max_value - param.min_value
-            if range_val == 0:
-                return np.ones(size) * param.min_value
-                
-            # Calculate shape parameters
-            mu = (param.min_value + 4 * param.most_likely + param.max_value) / 6
-            
-            # If mu is equal to min or max, avoid division by zero
-            if mu == param.min_value or mu == param.max_value:
-                return np.ones(size) * mu
-                
-            v = (mu - param.min_value) * (param.max_value - mu) / (
-                (param.max_value - param.min_value) ** 2
-            )
-            
-            w = ((mu - param.min_value) / (param.max_value - param.min_value)) * (
-                (1 / v) - 1
-            )
-            
-            alpha = w
-            beta = (1 - (mu - param.min_value) / (param.max_value - param.min_value)) * (
-                (1 / v) - 1
-            )
-            
-            # Generate beta samples and scale to the min-max range
-            beta_samples = np.random.beta(alpha, beta, size)
-            return param.min_value + beta_samples * range_val
-            
-        elif distribution == "lognormal":
-            # For lognormal, we interpret min/max as 5th and 95th percentiles
-            # (Appropriate for modeling losses that can be very large)
-            ln_min = np.log(param.min_value)
-            ln_max = np.log(param.max_value)
+        self._buf = None
+        self._results_df = None
+        if seed is None:
+            self._seed_seq = None
+            self._rngs = (MonteCarloSimulation._shared_rng,) * 3
+        else:
+            # Each input (TEF, Vulnerability, Loss Magnitude) draws from its own
+            # child stream, so models simulated from the same seed share common
+            # random numbers input by input, even when their distributions
+            # consume different numbers of variates. The children are spawned
+            # from a copy, so simulations given one shared SeedSequence
+            # instance draw the same streams too.
+            self._seed_seq = _as_seed_sequence(seed)
+            self._rngs = tuple(np.random.default_rng(child) for child in self._seed_seq.spawn(3))
+        
+    @classmethod
+    def run_batch(cls, models: List[FAIRModel], num_simulations: int = 10000,
+                  max_workers: Optional[int] = None, seed=None) -> List['MonteCarloSimulation']:
+        """
+        Run simulations for several scenarios in parallel worker processes.
+        
+        Args:
+            models: The configured FAIR models to simulate
+            num_simulations: Number of simulations to run per model (default: 10000)
+            max_workers: Maximum number of worker processes (default: one per CPU)
+            seed: Optional seed (int or np.random.SeedSequence) for reproducible runs
             
-            # Estimate mu and sigma for the lognormal distribution
-            # using the 5th and 95th percentiles
-            z_95 = 1.645  # Z-score for 95th percentile
-            sigma = (ln_max - ln_min) / (2 * z_95)
-            mu = (ln_min + ln_max) / 2
+        Returns:
+            A completed simulation for each model, in the same order
+        """
+        for model in models:
+            model.validate_inputs()
+        
+        # Give every scenario its own independent child stream of the seed
+        seeds = _as_seed_sequence(seed).spawn(len(models))
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            buffers = list(executor.map(
+                _simulate_one,
+                [model.to_dict() for model in models],
+                [num_simulations] * len(models),
+                seeds
+            ))
+        
+        simulations = []
+        for model, child_seed, buf in zip(models, seeds, buffers):
+            simulation = cls(model, num_simulations, seed=child_seed)
+            simulation._buf = buf
+            simulations.append(simulation)
+        
+        return simulations
+    
+    @classmethod
+    def run_vectorized(cls, models: List[FAIRModel], num_simulations: int = 10000,
+                       seed=None) -> List['MonteCarloSimulation']:
+        """
+        Run simulations for several scenarios at once in a single process.
+        
+        Inputs that share a distribution family are drawn together as one
+        (K, N) block, so the per-call overhead is paid per family rather
+        than per scenario.
+        
+        Args:
+            models: The configured FAIR models to simulate
+            num_simulations: Number of simulations to run per model (default: 10000)
+            seed: Optional seed (int or np.random.SeedSequence) for reproducible runs
             
-            return np.random.lognormal(mu, sigma, size)
+        Returns:
+            A completed simulation for each model, in the same order
+        """
+        for model in models:
+            model.validate_inputs()
         
-        else:
-            # Default to uniform distribution
-            return np.random.uniform(param.min_value, param.max_value, size)
-    
-    def run_simulation(self):
-        """Run the Monte Carlo simulation and store the results"""
-        # Validate that all inputs are set
-        self.fair_model.validate_inputs()
+        rng = np.random.default_rng(_as_seed_sequence(seed))
         
-        # Generate random samples for each input
-        tef_samples = self._generate_distribution_sample(
-            self.fair_model.tef, self.num_simulations
-        )
+        # A (K, 5, N) row-major block: each model's (5, N) slab transposes to
+        # the column-major (N, 5) buffer layout used by run_simulation
+        block = np.empty((len(models), len(RESULT_COLUMNS), num_simulations), dtype=RESULT_DTYPE)
         
-        vulnerability_samples = self._generate_distribution_sample(
-            self.fair_model.vulnerability, self.num_simulations
-        )
+        fill_many(rng, [model.tef._sampler for model in models], block[:, TEF])
+        fill_many(rng, [model.vulnerability._sampler for model in models], block[:, VULNERABILITY])
+        fill_many(rng, [model.loss_magnitude._sampler for model in models], block[:, LOSS_MAGNITUDE])
         
-        loss_magnitude_samples = self._generate_distribution_sample(
-            self.fair_model.loss_magnitude, self.num_simulations
-        )
+        np.multiply(block[:, TEF], block[:, VULNERABILITY], out=block[:, LEF])
+        np.multiply(block[:, LEF], block[:, LOSS_MAGNITUDE], out=block[:, ALE])
+        
+        simulations = []
+        for model, buf in zip(models, block):
+            simulation = cls(model, num_simulations)
+            simulation._buf = buf.T
+            simulations.append(simulation)
+        
+        return simulations
+    
+    @property
+    def results_arr(self) -> Optional[np.ndarray]:
+        """The raw (num_simulations, 5) results buffer, laid out as RESULT_COLUMNS"""
+        return self._buf
+    
+    @property
+    def results(self) -> Optional[pd.DataFrame]:
+        """The simulation results as a DataFrame, built from the buffer on first access"""
+        if self._buf is None:
+            return None
+        if self._results_df is None:
+            # Wrap the buffer without copying it
+            self._results_df = pd.DataFrame(self._buf, columns=RESULT_COLUMNS, copy=False)
+        return self._results_df
+    
+    def _generate_distribution_sample(self, param, out: np.ndarray, rng: np.random.Generator):
+        """Fill `out` in place with random samples from the specified distribution"""
+        # The sampler is bound once when the input is created, so there is
+        # no per-run distribution lookup here
+        param._sampler(rng, out)
+    
+    def _fill_rows(self, start: int, stop: int):
+        """Sample the inputs and compute the outputs for rows [start, stop) of the results buffer"""
+        # Row ranges of a column-major buffer are contiguous, so the samplers
+        # and multiplies below can write into them in place
+        rows = self._buf[start:stop]
+        tef_samples = rows[:, TEF]
+        vulnerability_samples = rows[:, VULNERABILITY]
+        lef_samples = rows[:, LEF]
+        loss_magnitude_samples = rows[:, LOSS_MAGNITUDE]
+        ale_samples = rows[:, ALE]
+        
+        tef_rng, vulnerability_rng, loss_magnitude_rng = self._rngs
+        self._generate_distribution_sample(self.fair_model.tef, tef_samples, tef_rng)
+        self._generate_distribution_sample(self.fair_model.vulnerability, vulnerability_samples, vulnerability_rng)
+        self._generate_distribution_sample(self.fair_model.loss_magnitude, loss_magnitude_samples, loss_magnitude_rng)
         
         # Calculate Loss Event Frequency (LEF)
-        lef_samples = tef_samples * vulnerability_samples
+        np.multiply(tef_samples, vulnerability_samples, out=lef_samples)
         
         # Calculate Annual Loss Expectancy (ALE)
-        ale_samples = lef_samples * loss_magnitude_samples
+        np.multiply(lef_samples, loss_magnitude_samples, out=ale_samples)
+    
+    def run_simulation(self):
+        """Run the Monte Carlo simulation and store the results"""
+        # Validate that all inputs are set
+        self.fair_model.validate_inputs()
+        
+        # Sample the inputs and compute the outputs in a single pre-allocated
+        # buffer. Column-major order keeps each column contiguous.
+        self._buf = np.empty((self.num_simulations, len(RESULT_COLUMNS)), dtype=RESULT_DTYPE, order='F')
+        self._fill_rows(0, self.num_simulations)
         
-        # Store results in a DataFrame
-        self.results = pd.DataFrame({
-            'TEF': tef_samples,
-            'Vulnerability': vulnerability_samples,
-            'LEF': lef_samples,
-            'Loss Magnitude': loss_magnitude_samples,
-            'ALE': ale_samples
-        })
+        self._results_df = None
         
         return self.results
     
     def get_summary_statistics(self) -> Dict:
         """Calculate summary statistics from the simulation results"""
-        if self.results is None:
+        if self._buf is None:
             raise ValueError("Simulation hasn't been run yet. Call run_simulation() first.")
         
-        # Calculate statistics for ALE
-        ale_percentiles = {
-            'min': self.results['ALE'].min(),
-            'max': self.results['ALE'].max(),
-            'mean': self.results['ALE'].mean(),
-            'median': self.results['ALE'].median(),
-            'std': self.results['ALE'].std(),
-            'percentile_10': self.results['ALE'].quantile(0.1),
-            'percentile_25': self.results['ALE'].quantile(0.25), 
-            'percentile_75': self.results['ALE'].quantile(0.75),
-            'percentile_90': self.results['ALE'].quantile(0.9),
-            'percentile_95': self.results['ALE'].quantile(0.95),
-            'percentile_99': self.results['ALE'].quantile(0.99)
-        }
-        
-        # Calculate statistics for LEF
-        lef_stats = {
-            'min': self.results['LEF'].min(),
-            'max': self.results['LEF'].max(),
-            'mean': self.results['LEF'].mean(),
-            'median': self.results['LEF'].median(),
-            'std': self.results['LEF'].std()
-        }
+        # Each statistic below is a single reduction over every column of the
+        # buffer. Means and standard deviations accumulate in double precision.
+        mins = self._buf.min(axis=0)
+        maxs = self._buf.max(axis=0)
+        means = self._buf.mean(axis=0, dtype=np.float64)
+        stds = self._buf.std(axis=0, dtype=np.float64, ddof=1)
+        quantiles = np.quantile(self._buf, _SUMMARY_QUANTILES, axis=0)
+        
+        def column_stats(column: int) -> Dict:
+            return {
+                'min': float(mins[column]),
+                'max': float(maxs[column]),
+                'mean': float(means[column]),
+                'median': float(quantiles[_SUMMARY_QUANTILES.index(0.5), column]),
+                'std': float(stds[column])
+            }
         
-        # Calculate statistics for Loss Magnitude
-        lm_stats = {
-            'min': self.results['Loss Magnitude'].min(),
-            'max': self.results['Loss Magnitude'].max(),
-            'mean': self.results['Loss Magnitude'].mean(),
-            'median': self.results['Loss Magnitude'].median(),
-            'std': self.results['Loss Magnitude'].std()
-        }
+        # Calculate statistics for ALE
+        ale_percentiles = column_stats(ALE)
+        for q, value in zip(_SUMMARY_QUANTILES, quantiles[:, ALE]):
+            if q != 0.5:
+                ale_percentiles[f'percentile_{round(q * 100)}'] = float(value)
         
         return {
             'ALE': ale_percentiles,
-            'LEF': lef_stats,
-            'Loss_Magnitude': lm_stats
+            'TEF': column_stats(TEF),
+            'Vulnerability': column_stats(VULNERABILITY),
+            'LEF': column_stats(LEF),
+            'Loss_Magnitude': column_stats(LOSS_MAGNITUDE)
         }
     
     def get_value_at_risk(self, confidence_level: float = 0.95) -> float:
@@ -175,7 +245,10 @@ class MonteCarloSimulation:
         Returns:
             The Value at Risk at the specified confidence level
         """
-        if self.results is None:
+        if self._buf is None:
             raise ValueError("Simulation hasn't been run yet. Call run_simulation() first.")
         
-        return self.results['ALE'].quantile(confidence_level)
+        # np.quantile uses a partial sort (introselect), not a full sort. Passing
+        # the level as a list interpolates in double precision, matching
+        # get_summary_statistics.
+        return float(np.quantile(self._buf[:, ALE], [confidence_level])[0])
@@ -1,17 +1,8 @@
+import copy
 import streamlit as st
 import pandas as pd
 import numpy as np
-from models.fair_model import FAIRModel, TEFInput, VulnerabilityInput, LossInput
-from models.monte_carlo import MonteCarloSimulation
-from utils.visualization import (
-    plot_loss_distribution, 
-    plot_cumulative_distribution,
-    plot_heat_map,
-    plot_sensitivity_analysis,
-    plot_loss_exceedance_curve,
-    format_currency
-)
-from utils.data_helpers import load_sample_scenarios
+from utils.data_helpers import load_sample_scenarios, load_sample_scenario_arrays
 
 # Set page configuration
 st.set_page_config(
@@ -21,8 +12,13 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.fragment
 def display_input_section():
     """Display the risk analysis input section"""
+    # Read the saved inputs from one plain-dict snapshot rather than going
+    # through the session state proxy for every widget default
+    state = st.session_state.to_dict()
+    
     st.header("Risk Scenario Configuration")
     
     col1, col2 = st.columns(2)
@@ -32,13 +28,13 @@ def display_input_section():
         
         scenario_name = st.text_input(
             "Scenario Name",
-            value=st.session_state.get("scenario_name", "New Risk Scenario"),
+            value=state.get("scenario_name", "New Risk Scenario"),
             help="Give your risk scenario a descriptive name"
         )
         
         scenario_description = st.text_area(
             "Scenario Description",
-            value=st.session_state.get("scenario_description", "Describe the risk scenario in detail"),
+            value=state.get("scenario_description", "Describe the risk scenario in detail"),
             help="Provide a detailed description of the risk scenario you're analyzing"
         )
     
@@ -78,14 +74,14 @@ def display_input_section():
             tef_min = st.number_input(
                 "Minimum TEF (events/year)",
                 min_value=0.0,
-                value=st.session_state.get("tef_min", 0.1),
+                value=state.get("tef_min", 0.1),
                 help="The minimum number of threat events expected per year"
             )
             
             tef_max = st.number_input(
                 "Maximum TEF (events/year)",
                 min_value=tef_min,
-                value=max(st.session_state.get("tef_max", 1.0), tef_min),
+                value=max(state.get("tef_max", 1.0), tef_min),
                 help="The maximum number of threat events expected per year"
             )
         
@@ -93,7 +89,7 @@ def display_input_section():
             tef_distribution = st.selectbox(
                 "TEF Distribution",
                 options=["Uniform", "Triangular", "PERT"],
-                index=1 if st.session_state.get("tef_distribution") == "Triangular" else 0,
+                index=1 if state.get("tef_distribution") == "Triangular" else 0,
                 help="The probability distribution to use for Threat Event Frequency"
             )
             
@@ -103,7 +99,7 @@ def display_input_section():
                     "Most Likely TEF (events/year)",
                     min_value=tef_min,
                     max_value=tef_max,
-                    value=min(max(st.session_state.get("tef_most_likely", (tef_min + tef_max) / 2), tef_min), tef_max),
+                    value=min(max(state.get("tef_most_likely", (tef_min + tef_max) / 2), tef_min), tef_max),
                     help="The most likely number of threat events per year"
                 )
     
@@ -127,7 +123,7 @@ def display_input_section():
                 "Minimum Vulnerability (probability)",
                 min_value=0.0,
                 max_value=1.0,
-                value=st.session_state.get("vuln_min", 0.2),
+                value=state.get("vuln_min", 0.2),
                 format="%.2f",
                 help="The minimum probability that a threat event becomes a loss event"
             )
@@ -136,7 +132,7 @@ def display_input_section():
                 "Maximum Vulnerability (probability)",
                 min_value=vuln_min,
                 max_value=1.0,
-                value=max(st.session_state.get("vuln_max", 0.5), vuln_min),
+                value=max(state.get("vuln_max", 0.5), vuln_min),
                 format="%.2f",
                 help="The maximum probability that a threat event becomes a loss event"
             )
@@ -145,7 +141,7 @@ def display_input_section():
             vuln_distribution = st.selectbox(
                 "Vulnerability Distribution",
                 options=["Uniform", "Triangular", "PERT"],
-                index=1 if st.session_state.get("vuln_distribution") == "Triangular" else 0,
+                index=1 if state.get("vuln_distribution") == "Triangular" else 0,
                 help="The probability distribution to use for Vulnerability"
             )
             
@@ -155,7 +151,7 @@ def display_input_section():
                     "Most Likely Vulnerability (probability)",
                     min_value=vuln_min,
                     max_value=vuln_max,
-                    value=min(max(st.session_state.get("vuln_most_likely", (vuln_min + vuln_max) / 2), vuln_min), vuln_max),
+                    value=min(max(state.get("vuln_most_likely", (vuln_min + vuln_max) / 2), vuln_min), vuln_max),
                     format="%.2f",
                     help="The most likely probability that a threat event becomes a loss event"
                 )
@@ -179,14 +175,14 @@ def display_input_section():
             loss_min = st.number_input(
                 "Minimum Loss ($)",
                 min_value=0,
-                value=int(st.session_state.get("loss_min", 10000)),
+                value=int(state.get("loss_min", 10000)),
                 help="The minimum expected loss amount in dollars"
             )
             
             loss_max = st.number_input(
                 "Maximum Loss ($)",
                 min_value=loss_min,
-                value=max(int(st.session_state.get("loss_max", 500000)), loss_min),
+                value=max(int(state.get("loss_max", 500000)), loss_min),
                 help="The maximum expected loss amount in dollars"
             )
         
@@ -194,7 +190,7 @@ def display_input_section():
             loss_distribution = st.selectbox(
                 "Loss Magnitude Distribution",
                 options=["Uniform", "Triangular", "PERT", "Lognormal"],
-                index=2 if st.session_state.get("loss_distribution") == "PERT" else 0,
+                index=2 if state.get("loss_distribution") == "PERT" else 0,
                 help="The probability distribution to use for Loss Magnitude"
             )
             
@@ -204,7 +200,7 @@ def display_input_section():
                     "Most Likely Loss ($)",
                     min_value=loss_min,
                     max_value=loss_max,
-                    value=min(max(int(st.session_state.get("loss_most_likely", (loss_min + loss_max) / 2)), loss_min), loss_max),
+                    value=min(max(int(state.get("loss_most_likely", (loss_min + loss_max) / 2)), loss_min), loss_max),
                     help="The most likely loss amount in dollars"
                 )
     
@@ -215,13 +211,16 @@ def display_input_section():
         "Number of Monte Carlo Simulations",
         min_value=1000,
         max_value=100000,
-        value=st.session_state.get("num_simulations", 10000),
+        value=state.get("num_simulations", 10000),
         step=1000,
         help="More simulations provide more stable results but take longer to compute"
     )
     
     # Save inputs to session state
     if st.button("Save Inputs & Run Simulation"):
+        # Imported here so the model code only loads once a run is requested
+        from models.fair_model import FAIRModel, TEFInput, VulnerabilityInput, LossInput
+        
         # Create FAIR model
         fair_model = FAIRModel(
             name=scenario_name,
@@ -252,78 +251,157 @@ def display_input_section():
             distribution=loss_distribution.lower()
         ))
         
-        # Store in session state
-        st.session_state["fair_model"] = fair_model
-        st.session_state["num_simulations"] = num_simulations
-        
-        # Also store individual values for form persistence
-        st.session_state["scenario_name"] = scenario_name
-        st.session_state["scenario_description"] = scenario_description
-        st.session_state["tef_min"] = tef_min
-        st.session_state["tef_max"] = tef_max
-        st.session_state["tef_most_likely"] = tef_most_likely
-        st.session_state["tef_distribution"] = tef_distribution
-        st.session_state["vuln_min"] = vuln_min
-        st.session_state["vuln_max"] = vuln_max
-        st.session_state["vuln_most_likely"] = vuln_most_likely
-        st.session_state["vuln_distribution"] = vuln_distribution
-        st.session_state["loss_min"] = loss_min
-        st.session_state["loss_max"] = loss_max
-        st.session_state["loss_most_likely"] = loss_most_likely
-        st.session_state["loss_distribution"] = loss_distribution
+        # Store in session state, along with the individual values for
+        # form persistence, in a single update
+        st.session_state.update({
+            "fair_model": fair_model,
+            "num_simulations": num_simulations,
+            "scenario_name": scenario_name,
+            "scenario_description": scenario_description,
+            "tef_min": tef_min,
+            "tef_max": tef_max,
+            "tef_most_likely": tef_most_likely,
+            "tef_distribution": tef_distribution,
+            "vuln_min": vuln_min,
+            "vuln_max": vuln_max,
+            "vuln_most_likely": vuln_most_likely,
+            "vuln_distribution": vuln_distribution,
+            "loss_min": loss_min,
+            "loss_max": loss_max,
+            "loss_most_likely": loss_most_likely,
+            "loss_distribution": loss_distribution
+        })
         
         # Run the simulation
         run_simulation(fair_model, num_simulations)
         
-        # Rerun to show results
+        # Rerun the whole page (not just this fragment) to show results
         st.rerun()
 
+# Results charts are read-only, so skip the Plotly toolbar
+_CHART_CONFIG = {"displayModeBar": False}
+
+def _model_key(fair_model):
+    """Hashable snapshot of the FAIR inputs that determine the simulation results"""
+    from models.fair_model import FAIRKey
+    
+    return FAIRKey.from_model(fair_model)
+
+@st.cache_data(show_spinner=False)
+def _simulate(model_key, num_simulations):
+    """Run the Monte Carlo simulation, cached on the model inputs and simulation count"""
+    from models.monte_carlo import MonteCarloSimulation
+    
+    # Rebuild the model from the key, so the cached results can only ever
+    # belong to the inputs they are cached under
+    simulation = MonteCarloSimulation(model_key.to_model(), num_simulations)
+    results = simulation.run_simulation()
+    return results, simulation.get_summary_statistics()
+
 def run_simulation(fair_model, num_simulations):
     """Run the Monte Carlo simulation and store results in session state"""
-    # Create and run the simulation
-    simulation = MonteCarloSimulation(fair_model, num_simulations)
-    results = simulation.run_simulation()
+    # Reruns with unchanged inputs are served from the cache instead of
+    # drawing a fresh set of samples
+    sim_key = (_model_key(fair_model), num_simulations)
+    results, summary = _simulate(*sim_key)
     
     # Store results in session state
     st.session_state["simulation_results"] = results
-    st.session_state["simulation_summary"] = simulation.get_summary_statistics()
+    st.session_state["simulation_summary"] = summary
+    st.session_state["last_sim_key"] = sim_key
+
+def _stats_table(title, rows):
+    """Render a statistics subsection as a heading and a single dataframe element"""
+    st.markdown(f"#### {title}")
+    st.dataframe(
+        pd.DataFrame(rows, columns=["Statistic", "Value"]),
+        use_container_width=True,
+        hide_index=True
+    )
+
+@st.cache_data(show_spinner=False)
+def _results_csv(results):
+    """Encode the simulation results as CSV, cached so reruns skip the float formatting"""
+    return results.to_csv(index=False).encode("utf-8")
 
+def _result_figures(results):
+    """Build the result charts, reusing them on reruns until the results change"""
+    cached = st.session_state.get("result_figures")
+    if cached is not None and cached[0] is results:
+        return cached[1]
+    
+    from utils.visualization import (
+        plot_loss_distribution,
+        plot_cumulative_distribution,
+        plot_sensitivity_analysis,
+        plot_loss_exceedance_curve
+    )
+    
+    # Sort the ALE samples once and share them across the distribution plots
+    ale_sorted = np.sort(results["ALE"].to_numpy())
+    figures = (
+        plot_loss_distribution(results, ale_sorted=ale_sorted),
+        plot_cumulative_distribution(results, ale_sorted=ale_sorted),
+        plot_loss_exceedance_curve(results, ale_sorted=ale_sorted),
+        plot_sensitivity_analysis(results)
+    )
+    
+    # Keyed on the results object itself, so results stored by any page
+    # (including the case studies) get their own charts
+    st.session_state["result_figures"] = (results, figures)
+    return figures
+
+@st.fragment
 def display_results():
     """Display the results of the risk analysis"""
     if "simulation_results" not in st.session_state:
         st.warning("Please configure your risk scenario and run the simulation first.")
         return
     
+    # The plotting module (and Plotly with it) is only imported once there
+    # are results to show, rather than on every page load
+    from utils.visualization import format_currency
+    
     st.header("Risk Analysis Results")
     st.subheader(f"Scenario: {st.session_state['fair_model'].name}")
     
     # Display summary statistics
     stats = st.session_state["simulation_summary"]
     
+    # Format the headline ALE figures once; they are shown in the metrics,
+    # the detailed statistics and the interpretation below
+    fmt_mean = format_currency(stats["ALE"]["mean"])
+    fmt_median = format_currency(stats["ALE"]["median"])
+    fmt_p95 = format_currency(stats["ALE"]["percentile_95"])
+    
     # Create 3 columns for the key metrics
     col1, col2, col3 = st.columns(3)
     
     with col1:
         st.metric(
             "Average Annual Loss",
-            format_currency(stats["ALE"]["mean"]),
+            fmt_mean,
             help="The expected average loss per year over time"
         )
     
     with col2:
         st.metric(
             "Median Annual Loss",
-            format_currency(stats["ALE"]["median"]),
+            fmt_median,
             help="The middle value of the annual loss distribution (50% of simulations are below this value)"
         )
     
     with col3:
         st.metric(
             "95th Percentile Loss",
-            format_currency(stats["ALE"]["percentile_95"]),
+            fmt_p95,
             help="The 'worst case' annual loss (only 5% of simulations exceed this value)"
         )
     
+    # Charts are rebuilt only when there are new results
+    results = st.session_state["simulation_results"]
+    loss_fig, cdf_fig, exceedance_fig, sensitivity_fig = _result_figures(results)
+    
     # Create tabs for different visualizations
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "Loss Distribution", 
@@ -336,8 +414,9 @@ def display_results():
     with tab1:
         st.subheader("Annual Loss Expectancy Distribution")
         st.plotly_chart(
-            plot_loss_distribution(st.session_state["simulation_results"]),
-            use_container_width=True
+            loss_fig,
+            use_container_width=True,
+            config=_CHART_CONFIG
         )
         
         st.markdown("""
@@ -354,8 +433,9 @@ def display_results():
     with tab2:
         st.subheader("Cumulative Probability Distribution")
         st.plotly_chart(
-            plot_cumulative_distribution(st.session_state["simulation_results"]),
-            use_container_width=True
+            cdf_fig,
+            use_container_width=True,
+            config=_CHART_CONFIG
         )
         
         st.markdown("""
@@ -372,8 +452,9 @@ def display_results():
     with tab3:
         st.subheader("Loss Exceedance Curve")
         st.plotly_chart(
-            plot_loss_exceedance_curve(st.session_state["simulation_results"]),
-            use_container_width=True
+            exceedance_fig,
+            use_container_width=True,
+            config=_CHART_CONFIG
         )
         
         st.markdown("""
@@ -390,8 +471,9 @@ def display_results():
     with tab4:
         st.subheader("Sensitivity Analysis")
         st.plotly_chart(
-            plot_sensitivity_analysis(st.session_state["simulation_results"]),
-            use_container_width=True
+            sensitivity_fig,
+            use_container_width=True,
+            config=_CHART_CONFIG
         )
         
         st.markdown("""
@@ -411,62 +493,68 @@ def display_results():
         # Create 2 columns for TEF/Vulnerability and Loss Magnitude/ALE
         col1, col2 = st.columns(2)
         
+        tef_stats = stats["TEF"]
+        vuln_stats = stats["Vulnerability"]
+        lm_stats = stats["Loss_Magnitude"]
+        ale_stats = stats["ALE"]
+        
         with col1:
-            st.markdown("#### Threat Event Frequency (events/year)")
-            st.write(f"Min: {stats['LEF']['min']:.4f}")
-            st.write(f"Max: {stats['LEF']['max']:.4f}")
-            st.write(f"Mean: {stats['LEF']['mean']:.4f}")
-            st.write(f"Median: {stats['LEF']['median']:.4f}")
+            _stats_table("Threat Event Frequency (events/year)", [
+                ("Min", f"{tef_stats['min']:.4f}"),
+                ("Max", f"{tef_stats['max']:.4f}"),
+                ("Mean", f"{tef_stats['mean']:.4f}"),
+                ("Median", f"{tef_stats['median']:.4f}")
+            ])
             
-            st.markdown("#### Vulnerability (probability)")
-            st.write(f"Min: {stats['LEF']['min']:.4f}")
-            st.write(f"Max: {stats['LEF']['max']:.4f}")
-            st.write(f"Mean: {stats['LEF']['mean']:.4f}")
-            st.write(f"Median: {stats['LEF']['median']:.4f}")
+            _stats_table("Vulnerability (probability)", [
+                ("Min", f"{vuln_stats['min']:.4f}"),
+                ("Max", f"{vuln_stats['max']:.4f}"),
+                ("Mean", f"{vuln_stats['mean']:.4f}"),
+                ("Median", f"{vuln_stats['median']:.4f}")
+            ])
         
         with col2:
-            st.markdown("#### Loss Magnitude ($)")
-            st.write(f"Min: {format_currency(stats['Loss_Magnitude']['min'])}")
-            st.write(f"Max: {format_currency(stats['Loss_Magnitude']['max'])}")
-            st.write(f"Mean: {format_currency(stats['Loss_Magnitude']['mean'])}")
-            st.write(f"Median: {format_currency(stats['Loss_Magnitude']['median'])}")
+            _stats_table("Loss Magnitude ($)", [
+                ("Min", format_currency(lm_stats['min'])),
+                ("Max", format_currency(lm_stats['max'])),
+                ("Mean", format_currency(lm_stats['mean'])),
+                ("Median", format_currency(lm_stats['median']))
+            ])
             
-            st.markdown("#### Annual Loss Expectancy ($)")
-            st.write(f"Min: {format_currency(stats['ALE']['min'])}")
-            st.write(f"Max: {format_currency(stats['ALE']['max'])}")
-            st.write(f"Mean: {format_currency(stats['ALE']['mean'])}")
-            st.write(f"Median: {format_currency(stats['ALE']['median'])}")
-            st.write(f"Standard Deviation: {format_currency(stats['ALE']['std'])}")
-            st.write(f"90th Percentile: {format_currency(stats['ALE']['percentile_90'])}")
-            st.write(f"95th Percentile: {format_currency(stats['ALE']['percentile_95'])}")
-            st.write(f"99th Percentile: {format_currency(stats['ALE']['percentile_99'])}")
+            _stats_table("Annual Loss Expectancy ($)", [
+                ("Min", format_currency(ale_stats['min'])),
+                ("Max", format_currency(ale_stats['max'])),
+                ("Mean", fmt_mean),
+                ("Median", fmt_median),
+                ("Standard Deviation", format_currency(ale_stats['std'])),
+                ("90th Percentile", format_currency(ale_stats['percentile_90'])),
+                ("95th Percentile", fmt_p95),
+                ("99th Percentile", format_currency(ale_stats['percentile_99']))
+            ])
     
     # Display risk interpretation
     st.header("Risk Interpretation")
     
-    mean_ale = stats["ALE"]["mean"]
-    p95_ale = stats["ALE"]["percentile_95"]
-    
     st.markdown(f"""
     ### Key Findings
     
     Based on the simulation results, we can make the following observations about this risk scenario:
     
-    - The **expected annual loss** is {format_currency(mean_ale)}.
-    - There is a **95% chance** that annual losses will not exceed {format_currency(p95_ale)}.
-    - There is a **50% chance** that annual losses will not exceed {format_currency(stats["ALE"]["median"])}.
+    - The **expected annual loss** is {fmt_mean}.
+    - There is a **95% chance** that annual losses will not exceed {fmt_p95}.
+    - There is a **50% chance** that annual losses will not exceed {fmt_median}.
     
     ### Recommendations
     
     When evaluating potential security controls or mitigation strategies:
     
-    1. Consider controls that cost less than the expected annual loss of {format_currency(mean_ale)} for positive ROI.
-    2. For risk transfer strategies (like insurance), consider coverage that addresses the 95th percentile loss of {format_currency(p95_ale)}.
+    1. Consider controls that cost less than the expected annual loss of {fmt_mean} for positive ROI.
+    2. For risk transfer strategies (like insurance), consider coverage that addresses the 95th percentile loss of {fmt_p95}.
     3. Based on the sensitivity analysis, focus on controls that address the most impactful factors.
     """)
     
     # Option to download the results as CSV
-    results_csv = st.session_state["simulation_results"].to_csv(index=False)
+    results_csv = _results_csv(results)
     st.download_button(
         label="Download Simulation Results as CSV",
         data=results_csv,
@@ -485,37 +573,35 @@ def main():
         
         # Check if the scenario exists
         if selected_scenario in sample_scenarios:
-            # Load the selected scenario
-            fair_model = sample_scenarios[selected_scenario]
-            
-            # Store in session state
-            st.session_state["fair_model"] = fair_model
-            st.session_state["scenario_name"] = fair_model.name
-            st.session_state["scenario_description"] = fair_model.description
-            
-            # Store TEF parameters
-            st.session_state["tef_min"] = fair_model.tef.min_value
-            st.session_state["tef_max"] = fair_model.tef.max_value
-            st.session_state["tef_most_likely"] = fair_model.tef.most_likely
-            st.session_state["tef_distribution"] = fair_model.tef.distribution.capitalize()
-            
-            # Store Vulnerability parameters
-            st.session_state["vuln_min"] = fair_model.vulnerability.min_value
-            st.session_state["vuln_max"] = fair_model.vulnerability.max_value
-            st.session_state["vuln_most_likely"] = fair_model.vulnerability.most_likely
-            st.session_state["vuln_distribution"] = fair_model.vulnerability.distribution.capitalize()
+            # Load the selected scenario. The scenarios are a shared cached
+            # resource, so work on a copy rather than the cached model.
+            fair_model = copy.deepcopy(sample_scenarios[selected_scenario])
             
-            # Store Loss Magnitude parameters
-            st.session_state["loss_min"] = fair_model.loss_magnitude.min_value
-            st.session_state["loss_max"] = fair_model.loss_magnitude.max_value
-            st.session_state["loss_most_likely"] = fair_model.loss_magnitude.most_likely
-            st.session_state["loss_distribution"] = fair_model.loss_magnitude.distribution.capitalize()
+            # The widget values for the TEF, Vulnerability and Loss Magnitude
+            # inputs come from the scenario's row of the parameter arrays
+            arrays = load_sample_scenario_arrays()
+            row = int(np.flatnonzero(arrays["name"] == selected_scenario)[0])
+            inputs = {}
+            for prefix, state_prefix in (("tef", "tef"), ("vulnerability", "vuln"), ("loss_magnitude", "loss")):
+                inputs[f"{state_prefix}_min"] = float(arrays[f"{prefix}_min"][row])
+                inputs[f"{state_prefix}_max"] = float(arrays[f"{prefix}_max"][row])
+                inputs[f"{state_prefix}_most_likely"] = float(arrays[f"{prefix}_most_likely"][row])
+                inputs[f"{state_prefix}_distribution"] = str(arrays[f"{prefix}_distribution"][row]).capitalize()
             
-            # Set number of simulations
-            st.session_state["num_simulations"] = 10000
+            # Store the model, its input parameters and the number of
+            # simulations in a single update
+            st.session_state.update({
+                "fair_model": fair_model,
+                "scenario_name": fair_model.name,
+                "scenario_description": fair_model.description,
+                **inputs,
+                "num_simulations": 10000
+            })
             
-            # Run the simulation
-            run_simulation(fair_model, 10000)
+            # Run the simulation, unless the results on display are already
+            # for these inputs
+            if st.session_state.get("last_sim_key") != (_model_key(fair_model), 10000):
+                run_simulation(fair_model, 10000)
             
             # Clear the selected sample to prevent reloading
             st.session_state["selected_sample"] = None
@@ -1,12 +1,18 @@
+import copy
+import threading
 import streamlit as st
 import pandas as pd
 import numpy as np
-from models.fair_model import FAIRModel
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import cycle
+import plotly.express as px
+import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from models.fair_model import FAIRKey
 from models.monte_carlo import MonteCarloSimulation
 from utils.visualization import (
     plot_loss_distribution, 
     plot_cumulative_distribution, 
-    plot_loss_exceedance_curve,
     format_currency
 )
 from utils.data_helpers import load_case_studies
@@ -19,6 +25,84 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+def _model_key(fair_model):
+    """Hashable snapshot of the FAIR inputs that determine the simulation results"""
+    return FAIRKey.from_model(fair_model)
+
+# Points drawn on the case study CDF curves; the statistics above the
+# charts are still computed from every sample
+DISPLAY_N = 2000
+
+# Case study charts are read-only, so skip the Plotly toolbar
+_CHART_CONFIG = {"displayModeBar": False}
+
+# Seed for every case study simulation. Each case shows the same numbers in
+# the comparison as on its own, and the compared cases are simulated with
+# common random numbers, so their differences are not sampling noise.
+_CASE_STUDY_SEED = 0
+
+@st.cache_data(show_spinner=False)
+def _simulate(model_key, num_simulations):
+    """Run the Monte Carlo simulation, cached on the model inputs and simulation count"""
+    # Rebuild the model from the key, so the cached results can only ever
+    # belong to the inputs they are cached under
+    simulation = MonteCarloSimulation(model_key.to_model(), num_simulations, seed=_CASE_STUDY_SEED)
+    results = simulation.run_simulation()
+    return results, simulation.get_summary_statistics()
+
+def run_simulation(fair_model, num_simulations=10000):
+    """Return the (results, summary statistics) of a simulation, served from the cache on reruns"""
+    # Results already used in this session are kept in session state, which
+    # skips unpickling a fresh copy from st.cache_data on every rerun. An
+    # entry may still be a background run started by precompute_case_studies.
+    session_results = st.session_state.setdefault("case_study_results", {})
+    key = (_model_key(fair_model), num_simulations)
+    result = session_results.get(key)
+    if result is None:
+        result = session_results[key] = _simulate(*key)
+    elif isinstance(result, Future):
+        result = session_results[key] = result.result()
+    return result
+
+@st.cache_resource(show_spinner=False)
+def _executor():
+    """Thread pool shared by every session for background case study simulations"""
+    return ThreadPoolExecutor(max_workers=4)
+
+def _simulate_in_background(ctx, key):
+    """Run _simulate on a pool thread, under the script run context that started it"""
+    # st.cache_data expects a script run context on the calling thread
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return _simulate(*key)
+
+def precompute_case_studies(case_studies, num_simulations=10000):
+    """Start loading every case study not yet in session state in the background"""
+    # Going through _simulate fills st.cache_data too, so later sessions only
+    # copy the cached results. The runs overlap with drawing the page, and
+    # run_simulation waits for a case only when it is first shown.
+    session_results = st.session_state.setdefault("case_study_results", {})
+    ctx = get_script_run_ctx()
+    for case_study in case_studies.values():
+        key = (_model_key(case_study["fair_model"]), num_simulations)
+        if key not in session_results:
+            session_results[key] = _executor().submit(_simulate_in_background, ctx, key)
+
+def _case_study_figures(title, results):
+    """Build a case study's charts, reusing them on reruns until its results change"""
+    session_figures = st.session_state.setdefault("case_study_figures", {})
+    cached = session_figures.get(title)
+    if cached is not None and cached[0] is results:
+        return cached[1]
+    
+    # Sort the ALE samples once for both charts
+    ale_sorted = np.sort(results["ALE"].to_numpy())
+    figures = (
+        plot_loss_distribution(results, ale_sorted=ale_sorted),
+        plot_cumulative_distribution(results, ale_sorted=ale_sorted, max_points=DISPLAY_N)
+    )
+    session_figures[title] = (results, figures)
+    return figures
+
 def display_case_study(case_study):
     """Display a detailed case study with analysis and visualizations"""
     st.header(case_study["title"])
@@ -52,9 +136,7 @@ def display_case_study(case_study):
     
     # Run Monte Carlo simulation
     fair_model = case_study["fair_model"]
-    simulation = MonteCarloSimulation(fair_model, 10000)
-    results = simulation.run_simulation()
-    stats = simulation.get_summary_statistics()
+    results, stats = run_simulation(fair_model, 10000)
     
     # Display key metrics
     st.subheader("Risk Quantification")
@@ -84,17 +166,13 @@ def display_case_study(case_study):
     # Create tabs for visualizations
     tab1, tab2 = st.tabs(["Loss Distribution", "Cumulative Probability"])
     
+    loss_fig, cdf_fig = _case_study_figures(case_study["title"], results)
+    
     with tab1:
-        st.plotly_chart(
-            plot_loss_distribution(results),
-            use_container_width=True
-        )
+        st.plotly_chart(loss_fig, use_container_width=True, config=_CHART_CONFIG)
     
     with tab2:
-        st.plotly_chart(
-            plot_cumulative_distribution(results),
-            use_container_width=True
-        )
+        st.plotly_chart(cdf_fig, use_container_width=True, config=_CHART_CONFIG)
     
     # Key lessons learned
     st.subheader("Key Lessons")
@@ -118,8 +196,9 @@ def display_case_study(case_study):
     
     # Option to use this case study as a basis for your own analysis
     if st.button("Use This Scenario as Template"):
-        # Store the FAIR model in session state
-        st.session_state["fair_model"] = fair_model
+        # Store the FAIR model in session state. The case studies are a shared
+        # cached resource, so store a copy rather than the cached model.
+        st.session_state["fair_model"] = copy.deepcopy(fair_model)
         st.session_state["scenario_name"] = fair_model.name
         st.session_state["scenario_description"] = fair_model.description
         
@@ -144,13 +223,11 @@ def display_case_study(case_study):
         # Set number of simulations
         st.session_state["num_simulations"] = 10000
         
-        # Run the simulation
-        simulation = MonteCarloSimulation(fair_model, 10000)
-        results = simulation.run_simulation()
-        
-        # Store in session state
+        # Store the simulation results in session state. They were not run
+        # by the risk analysis page, so drop its record of the last run.
         st.session_state["simulation_results"] = results
-        st.session_state["simulation_summary"] = simulation.get_summary_statistics()
+        st.session_state["simulation_summary"] = stats
+        st.session_state.pop("last_sim_key", None)
         
         # Navigate to the risk analysis page
         st.switch_page("pages/1_Risk_Analysis.py")
@@ -170,25 +247,23 @@ def compare_case_studies(case_studies):
         st.warning("Please select at least two case studies to compare.")
         return
     
-    # Run simulations for each selected case study
+    # Run simulations for each selected case study, keeping the summary
+    # statistics of each run for the comparison table
     simulation_results = []
     labels = []
+    stats_list = []
     
     for case_name in selected_cases:
         fair_model = case_studies[case_name]["fair_model"]
-        simulation = MonteCarloSimulation(fair_model, 10000)
-        results = simulation.run_simulation()
+        results, stats = run_simulation(fair_model, 10000)
         simulation_results.append(results)
         labels.append(case_name)
+        stats_list.append(stats)
     
     # Create comparison table
     comparison_data = []
     
-    for i, case_name in enumerate(selected_cases):
-        stats = MonteCarloSimulation(
-            case_studies[case_name]["fair_model"], 10000
-        ).get_summary_statistics()
-        
+    for case_name, stats in zip(selected_cases, stats_list):
         comparison_data.append({
             "Case Study": case_name,
             "Industry": case_studies[case_name]["industry"],
@@ -202,33 +277,45 @@ def compare_case_studies(case_studies):
     # Convert to DataFrame and display
     comparison_df = pd.DataFrame(comparison_data)
     
-    # Format currency columns
-    for col in ["Mean Annual Loss", "Median Annual Loss", "95th Percentile Loss", "Mean Loss Magnitude"]:
-        comparison_df[col] = comparison_df[col].apply(format_currency)
-    
-    # Format frequency column
-    comparison_df["Mean Loss Event Frequency"] = comparison_df["Mean Loss Event Frequency"].apply(
-        lambda x: f"{x:.2f} events/year"
+    # Keep the columns numeric and let the frontend format them
+    currency_column = st.column_config.NumberColumn(format="dollar")
+    st.dataframe(
+        comparison_df,
+        column_config={
+            "Mean Annual Loss": currency_column,
+            "Median Annual Loss": currency_column,
+            "95th Percentile Loss": currency_column,
+            "Mean Loss Magnitude": currency_column,
+            "Mean Loss Event Frequency": st.column_config.NumberColumn(format="%.2f events/year")
+        },
+        use_container_width=True
     )
     
-    st.dataframe(comparison_df, use_container_width=True)
-    
     # Create loss distribution comparison
     st.subheader("Annual Loss Expectancy Comparison")
     
     # Create a combined histogram
-    import plotly.graph_objects as go
-    
     fig = go.Figure()
-    colors = ["blue", "red", "green", "purple", "orange"]
-    
-    for i, (results, label) in enumerate(zip(simulation_results, labels)):
-        fig.add_trace(go.Histogram(
-            x=results["ALE"],
+    color_cycle = cycle(px.colors.qualitative.Plotly)
+    
+    # Bin every case on the same edges here, so the bars line up and only
+    # the bin densities are sent to the browser
+    edges = np.histogram_bin_edges(
+        [min(results["ALE"].min() for results in simulation_results),
+         max(results["ALE"].max() for results in simulation_results)],
+        bins=60
+    )
+    centers = 0.5 * (edges[1:] + edges[:-1])
+    
+    for results, label in zip(simulation_results, labels):
+        density, _ = np.histogram(results["ALE"], bins=edges, density=True)
+        fig.add_trace(go.Bar(
+            x=centers,
+            y=density,
+            width=np.diff(edges),
             name=label,
             opacity=0.7,
-            histnorm='probability density',
-            marker_color=colors[i % len(colors)]
+            marker_color=next(color_cycle)
         ))
     
     fig.update_layout(
@@ -236,19 +323,17 @@ def compare_case_studies(case_studies):
         xaxis_title="Annual Loss Expectancy ($)",
         yaxis_title="Probability Density",
         barmode='overlay',
+        bargap=0,
         height=500
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
     
     # Comparison insights
     st.subheader("Comparison Insights")
     
     # Sort case studies by mean annual loss
-    sorted_cases = sorted(
-        comparison_data,
-        key=lambda x: float(x["Mean Annual Loss"].replace("$", "").replace(",", ""))
-    )
+    sorted_cases = sorted(comparison_data, key=lambda x: x["Mean Annual Loss"])
     
     highest_risk = sorted_cases[-1]["Case Study"]
     lowest_risk = sorted_cases[0]["Case Study"]
@@ -285,18 +370,22 @@ def main():
     # Load case studies
     case_studies = load_case_studies()
     
-    # Create tabs for individual case studies and comparison
-    tabs = ["Comparison"] + list(case_studies.keys())
-    selected_tab = st.tabs(tabs)
+    # Start loading every case study in the background, so switching between
+    # them is instant
+    precompute_case_studies(case_studies)
+    
+    # Create tabs for the comparison and for exploring individual case studies
+    comparison_tab, explore_tab = st.tabs(["Comparison", "Explore"])
     
     # Comparison tab
-    with selected_tab[0]:
+    with comparison_tab:
         compare_case_studies(case_studies)
     
-    # Individual case study tabs
-    for i, case_name in enumerate(case_studies.keys()):
-        with selected_tab[i+1]:
-            display_case_study(case_studies[case_name])
+    # Individual case study tab. Streamlit runs the body of every tab on each
+    # rerun, so only the chosen case study is rendered rather than all of them.
+    with explore_tab:
+        case_name = st.radio("Case study", list(case_studies.keys()), horizontal=True)
+        display_case_study(case_studies[case_name])
 
 if __name__ == "__main__":
     main()
@@ -1,76 +1,122 @@
+import functools
+from itertools import cycle
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-import matplotlib.pyplot as plt
-import streamlit as st
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
-def plot_loss_distribution(simulation_results: pd.DataFrame, bin_count: int = 50) -> go.Figure:
+# Curves are drawn from at most this many evenly spaced order statistics,
+# which is indistinguishable from the full sample at screen resolution
+_MAX_CURVE_POINTS = 5000
+
+def _curve_indices(num_samples: int, max_points: int = _MAX_CURVE_POINTS) -> np.ndarray:
+    """Indices of the sorted samples to draw on a CDF-style curve"""
+    if num_samples <= max_points:
+        return np.arange(num_samples)
+    return np.unique(np.linspace(0, num_samples - 1, max_points).round().astype(np.intp))
+
+def _sorted_quantiles(ale_sorted: np.ndarray, quantiles: List[float]) -> np.ndarray:
+    """Linearly interpolated quantiles of an already sorted array, without re-sorting"""
+    position = np.asarray(quantiles) * (len(ale_sorted) - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, len(ale_sorted) - 1)
+    return ale_sorted[lower] + (position - lower) * (ale_sorted[upper] - ale_sorted[lower])
+
+def _add_percentile_lines(fig: go.Figure, values, colors: List[str], names: List[str]):
+    """Mark each value with a dashed vertical line and a label, in a single layout update"""
+    # Equivalent to one fig.add_vline per value, without a layout update per line
+    shapes = []
+    annotations = []
+    for value, color, name in zip(values, colors, names):
+        shapes.append(dict(
+            type='line', xref='x', yref='y domain',
+            x0=value, x1=value, y0=0, y1=1,
+            line=dict(color=color, dash='dash')
+        ))
+        annotations.append(dict(
+            xref='x', yref='y domain', x=value, y=1,
+            xanchor='left', yanchor='top', showarrow=False,
+            text=f"{name}: ${value:,.2f}"
+        ))
+    fig.update_layout(shapes=shapes, annotations=annotations)
+
+def plot_loss_distribution(simulation_results: pd.DataFrame, bin_count: int = 50,
+                           ale_sorted: Optional[np.ndarray] = None) -> go.Figure:
     """
     Create a histogram of the Annual Loss Expectancy (ALE) distribution.
     
     Args:
         simulation_results: DataFrame containing the simulation results
         bin_count: Number of bins to use in the histogram
+        ale_sorted: Optional pre-sorted ALE values, shared with the other plots
         
     Returns:
         Plotly figure object
     """
+    # Bin the samples here so only the bin densities are sent to the browser
+    ale = simulation_results['ALE'].to_numpy() if ale_sorted is None else ale_sorted
+    density, edges = np.histogram(ale, bins=bin_count, density=True)
+    
     # Create histogram
-    fig = px.histogram(
-        simulation_results, 
-        x="ALE", 
-        nbins=bin_count,
-        histnorm='probability density',
-        title="Annual Loss Expectancy (ALE) Distribution",
-        labels={"ALE": "Annual Loss Expectancy ($)"},
-        color_discrete_sequence=['#0066cc']
-    )
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=density,
+        width=np.diff(edges),
+        marker_color='#0066cc'
+    ))
     
     # Add vertical lines for key percentiles
     percentiles = [0.5, 0.9, 0.95]
     colors = ['green', 'orange', 'red']
     names = ['50% (Median)', '90th Percentile', '95th Percentile']
     
-    for percentile, color, name in zip(percentiles, colors, names):
-        value = simulation_results['ALE'].quantile(percentile)
-        fig.add_vline(
-            x=value, 
-            line_dash="dash", 
-            line_color=color,
-            annotation_text=f"{name}: ${value:,.2f}",
-            annotation_position="top right"
-        )
+    # Read the percentiles off the shared sorted array when there is one;
+    # otherwise np.quantile selects all three with a single partition
+    if ale_sorted is not None:
+        values = _sorted_quantiles(ale_sorted, percentiles)
+    else:
+        values = np.quantile(ale, percentiles)
+    
+    _add_percentile_lines(fig, values, colors, names)
     
     # Customize layout
     fig.update_layout(
+        title="Annual Loss Expectancy (ALE) Distribution",
         xaxis_title="Annual Loss Expectancy ($)",
         yaxis_title="Probability Density",
         legend_title="Percentiles",
+        bargap=0,
         height=500
     )
     
     return fig
 
-def plot_cumulative_distribution(simulation_results: pd.DataFrame) -> go.Figure:
+def plot_cumulative_distribution(simulation_results: pd.DataFrame,
+                                 ale_sorted: Optional[np.ndarray] = None,
+                                 max_points: int = _MAX_CURVE_POINTS) -> go.Figure:
     """
     Create a cumulative distribution function (CDF) plot for the ALE.
     
     Args:
         simulation_results: DataFrame containing the simulation results
+        ale_sorted: Optional pre-sorted ALE values, shared with the other plots
+        max_points: Maximum number of points used to draw the curve
         
     Returns:
         Plotly figure object
     """
-    # Sort the ALE values and compute the empirical CDF
-    ale_sorted = np.sort(simulation_results['ALE'].values)
-    cdf = np.arange(1, len(ale_sorted) + 1) / len(ale_sorted)
+    # Sort the ALE values (unless already sorted) and compute the empirical CDF
+    if ale_sorted is None:
+        ale_sorted = np.sort(simulation_results['ALE'].to_numpy(dtype=np.float32))
+    idx = _curve_indices(len(ale_sorted), max_points)
+    # The curve is display-only, so single precision matches the float32 ALE samples
+    cdf = ((idx + 1) / len(ale_sorted)).astype(np.float32)
     
     # Create the CDF plot
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=ale_sorted,
+        x=ale_sorted[idx],
         y=cdf,
         mode='lines',
         name='CDF',
@@ -82,15 +128,7 @@ def plot_cumulative_distribution(simulation_results: pd.DataFrame) -> go.Figure:
     colors = ['green', 'orange', 'red']
     names = ['50% (Median)', '90th Percentile', '95th Percentile']
     
-    for percentile, color, name in zip(percentiles, colors, names):
-        value = simulation_results['ALE'].quantile(percentile)
-        fig.add_vline(
-            x=value, 
-            line_dash="dash", 
-            line_color=color,
-            annotation_text=f"{name}: ${value:,.2f}",
-            annotation_position="top right"
-        )
+    _add_percentile_lines(fig, _sorted_quantiles(ale_sorted, percentiles), colors, names)
     
     # Customize layout
     fig.update_layout(
@@ -114,20 +152,21 @@ def plot_heat_map(simulation_results: pd.DataFrame, x_column: str, y_column: str
     Returns:
         Plotly figure object
     """
-    # Create bins for the x and y columns
-    x_bins = pd.cut(simulation_results[x_column], bins=20)
-    y_bins = pd.cut(simulation_results[y_column], bins=20)
-    
-    # Create a cross-tabulation of the binned data
-    heatmap_data = pd.crosstab(y_bins, x_bins, normalize=True)
+    # Bin both columns in a single 2D count, normalised to the fraction of samples per cell
+    counts, x_edges, y_edges = np.histogram2d(
+        simulation_results[x_column].to_numpy(),
+        simulation_results[y_column].to_numpy(),
+        bins=20
+    )
+    heatmap_values = counts.T / counts.sum()
     
-    # Convert to a format suitable for Plotly heatmap
-    heatmap_x = [str(interval) for interval in heatmap_data.columns]
-    heatmap_y = [str(interval) for interval in heatmap_data.index]
+    # Label each bin by its interval
+    heatmap_x = [f"[{lo:.3g}, {hi:.3g})" for lo, hi in zip(x_edges[:-1], x_edges[1:])]
+    heatmap_y = [f"[{lo:.3g}, {hi:.3g})" for lo, hi in zip(y_edges[:-1], y_edges[1:])]
     
     # Create the heatmap
     fig = go.Figure(data=go.Heatmap(
-        z=heatmap_data.values,
+        z=heatmap_values,
         x=heatmap_x,
         y=heatmap_y,
         colorscale='Blues',
@@ -154,12 +193,16 @@ def plot_sensitivity_analysis(simulation_results: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure object
     """
-    # Calculate correlation between input parameters and ALE
-    correlations = {}
+    # Calculate correlation between input parameters and ALE, all three in
+    # one pass over demeaned columns (in double precision)
     input_params = ['TEF', 'Vulnerability', 'Loss Magnitude']
+    inputs = simulation_results[input_params].to_numpy(dtype=np.float64)
+    ale = simulation_results['ALE'].to_numpy(dtype=np.float64)
     
-    for param in input_params:
-        correlations[param] = np.corrcoef(simulation_results[param], simulation_results['ALE'])[0, 1]
+    inputs = inputs - inputs.mean(axis=0)
+    ale = ale - ale.mean()
+    corrs = (ale @ inputs) / (np.linalg.norm(inputs, axis=0) * np.linalg.norm(ale))
+    correlations = dict(zip(input_params, corrs.tolist()))
     
     # Sort parameters by absolute correlation
     sorted_params = sorted(correlations.items(), key=lambda x: abs(x[1]), reverse=True)
@@ -167,18 +210,16 @@ def plot_sensitivity_analysis(simulation_results: pd.DataFrame) -> go.Figure:
     # Create the tornado chart
     fig = go.Figure()
     
-    # Add the bars
-    for param, corr in sorted_params:
-        fig.add_trace(go.Bar(
-            y=[param],
-            x=[corr],
-            orientation='h',
-            name=param,
-            marker=dict(
-                color='blue' if corr >= 0 else 'red',
-                line=dict(color='black', width=1)
-            )
-        ))
+    # Add the bars as a single trace, coloured by the sign of each correlation
+    fig.add_trace(go.Bar(
+        y=[param for param, _ in sorted_params],
+        x=[corr for _, corr in sorted_params],
+        orientation='h',
+        marker=dict(
+            color=['blue' if corr >= 0 else 'red' for _, corr in sorted_params],
+            line=dict(color='black', width=1)
+        )
+    ))
     
     # Customize layout
     fig.update_layout(
@@ -204,12 +245,29 @@ def create_boxplot_comparison(simulation_results: List[pd.DataFrame], labels: Li
     """
     fig = go.Figure()
     
-    for i, (results, label) in enumerate(zip(simulation_results, labels)):
+    # Look the palette up once and cycle through it, one colour per scenario
+    colors = cycle(px.colors.qualitative.Plotly)
+    
+    for results, label, color in zip(simulation_results, labels, colors):
+        # Send Plotly the box statistics rather than every sample. The
+        # whiskers end at the furthest samples within 1.5 IQR of the box,
+        # as Plotly would draw them; the outliers beyond are not shown.
+        ale = results['ALE'].to_numpy()
+        q1, median, q3 = np.percentile(ale, [25, 50, 75])
+        iqr = q3 - q1
+        lower_fence = ale[ale >= q1 - 1.5 * iqr].min()
+        upper_fence = ale[ale <= q3 + 1.5 * iqr].max()
+        
         fig.add_trace(go.Box(
-            y=results['ALE'],
+            q1=[q1],
+            median=[median],
+            q3=[q3],
+            lowerfence=[lower_fence],
+            upperfence=[upper_fence],
+            mean=[ale.mean(dtype=np.float64)],
             name=label,
             boxmean=True,  # adds a marker for the mean
-            marker_color=px.colors.qualitative.Plotly[i % len(px.colors.qualitative.Plotly)]
+            marker_color=color
         ))
     
     # Customize layout
@@ -222,30 +280,36 @@ def create_boxplot_comparison(simulation_results: List[pd.DataFrame], labels: Li
     
     return fig
 
+@functools.lru_cache(maxsize=256)
 def format_currency(value: float) -> str:
     """Format a value as a currency string with commas and 2 decimal places"""
     return f"${value:,.2f}"
 
-def plot_loss_exceedance_curve(simulation_results: pd.DataFrame) -> go.Figure:
+def plot_loss_exceedance_curve(simulation_results: pd.DataFrame,
+                               ale_sorted: Optional[np.ndarray] = None) -> go.Figure:
     """
     Create a loss exceedance curve, showing the probability of exceeding a certain loss.
     
     Args:
         simulation_results: DataFrame containing the simulation results
+        ale_sorted: Optional pre-sorted ALE values, shared with the other plots
         
     Returns:
         Plotly figure object
     """
-    # Sort the ALE values
-    ale_sorted = np.sort(simulation_results['ALE'].values)
+    # Sort the ALE values (unless already sorted)
+    if ale_sorted is None:
+        ale_sorted = np.sort(simulation_results['ALE'].to_numpy(dtype=np.float32))
     
-    # Calculate the exceedance probability (1 - CDF)
-    exceedance_prob = 1 - (np.arange(1, len(ale_sorted) + 1) / len(ale_sorted))
+    # Calculate the exceedance probability (1 - CDF) at the curve points only
+    num_samples = len(ale_sorted)
+    curve = _curve_indices(num_samples)
+    exceedance_prob = (1 - (curve + 1) / num_samples).astype(np.float32)
     
     # Create the exceedance curve
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=ale_sorted,
+        x=ale_sorted[curve],
         y=exceedance_prob,
         mode='lines',
         name='Exceedance Probability',
@@ -257,11 +321,13 @@ def plot_loss_exceedance_curve(simulation_results: pd.DataFrame) -> go.Figure:
     colors = ['green', 'orange', 'red']
     names = ['50% Chance', '10% Chance', '5% Chance']
     
-    for prob, color, name in zip(probabilities, colors, names):
-        # Find the loss value at this exceedance probability
-        idx = (np.abs(exceedance_prob - prob)).argmin()
-        value = ale_sorted[idx]
-        
+    # Find the loss value at each exceedance probability. The exceedance of
+    # sorted sample i is 1 - (i + 1) / n, so the closest sample is found
+    # directly rather than by scanning the whole curve.
+    idx = np.rint(num_samples * (1 - np.array(probabilities))).astype(np.intp) - 1
+    values = ale_sorted[np.clip(idx, 0, num_samples - 1)]
+    
+    for prob, value, color, name in zip(probabilities, values, colors, names):
         fig.add_hline(
             y=prob, 
             line_dash="dash", 